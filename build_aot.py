@@ -0,0 +1,27 @@
+"""
+Ahead-of-time compile the Monte Carlo kernels into a 'gacha_kernels'
+extension module, so no JIT compilation ever runs behind a button click.
+
+Run once at install/package time (requires Numba and a C compiler):
+
+    python build_aot.py
+
+The resulting gacha_kernels.{so,pyd} is picked up automatically by
+gachaWithUI and, unlike the JIT path, needs no Numba at runtime.
+"""
+from numba.pycc import CC
+
+from gachaWithUI import _mc, _simulate_pulls
+
+
+def _plain(func):
+    # Unwrap the @njit dispatcher back to the pure-Python function.
+    return getattr(func, 'py_func', func)
+
+
+cc = CC('gacha_kernels')
+cc.export('simulate_pulls', 'i8(i8, i8, f8, f8, f8[::1])')(_plain(_simulate_pulls))
+cc.export('mc', 'i8(i8, i8, i8, f8, f8, f8[::1])')(_plain(_mc))
+
+if __name__ == '__main__':
+    cc.compile()
@@ -1,257 +1,612 @@
-import tkinter as tk
-from tkinter import messagebox
-import random
-
-class GachaSimulator:
-    def __init__(self, base_4_rate=0.085, featured_rate=0.5):
-        """
-        Initialize the simulator.
-          - 5★ probability is determined by the soft pity mechanism:
-              • Pull 1–65: fixed at 0.8% (0.008)
-              • Pull 66–70: each pull increases the rate by 4% (0.04) over the base
-              • Pull 71–75: each pull increases the rate by 8% (0.08) over the previous pull
-              • Pull 76–78: each pull increases the rate by 10% (0.10) over the previous pull
-              • Pull 79: 100% chance
-          - 4★: no soft pity. However, if 9 consecutive pulls yield no 4★ or 5★, the 10th pull (if not 5★) is forced to be 4★.
-          - featured_rate applies to any 5★ pull: if the 50-50 check is lost, the next 5★ is guaranteed featured.
-        """
-        self.base_4_rate = base_4_rate
-        self.featured_rate = featured_rate
-        self.history = []            # List of pull outcomes
-        self.pity_5_counter = 0      # Pulls since last 5★ (for soft pity)
-        self.pity_4_counter = 0      # Pulls since last 4★ or higher
-        self.guaranteed_featured = False  # Flag: next 5★ is forced to be featured if previous 5★ lost the 50-50
-
-    def get_current_5_rate(self):
-        """
-        Determine the current 5★ rate based on the number of pulls since the last 5★.
-        """
-        pull_number = self.pity_5_counter + 1
-        if pull_number <= 65:
-            return 0.008
-        elif pull_number <= 70:
-            # Each pull from 66 to 70 increases by 4%
-            return 0.008 + (pull_number - 65) * 0.04
-        elif pull_number <= 75:
-            # Pulls 71 to 75: add 8% per pull (after the first 5 pulls of +4%)
-            return 0.008 + 5 * 0.04 + (pull_number - 70) * 0.08
-        elif pull_number <= 78:
-            # Pulls 76 to 78: add 10% per pull (after previous increases)
-            return 0.008 + 5 * 0.04 + 5 * 0.08 + (pull_number - 75) * 0.10
-        else:
-            # 79th pull and beyond: guaranteed 5★
-            return 1.0
-
-    def pull(self):
-        """
-        Simulate a single pull with the following order:
-          1. Roll for 5★ using soft pity.
-          2. If no 5★ is obtained, check if 9 consecutive pulls without 4★ or higher have occurred; if so, force a 4★.
-          3. Otherwise, roll for 4★ using the fixed probability.
-          4. If neither 5★ nor 4★ is obtained, return 3★.
-        Returns one of: "3*", "4*", "5*", or "featured 5*".
-        """
-        # --- Roll for 5★ first ---
-        current_5_rate = self.get_current_5_rate()
-        roll = random.random()
-        if roll < current_5_rate:
-            # 5★ obtained; reset pity counters.
-            self.pity_5_counter = 0
-            self.pity_4_counter = 0
-            if self.guaranteed_featured:
-                result = "featured 5*"
-                self.guaranteed_featured = False
-            else:
-                if random.random() < self.featured_rate:
-                    result = "featured 5*"
-                else:
-                    result = "5*"
-                    # Lost the 50-50, so next 5★ will be featured.
-                    self.guaranteed_featured = True
-            self.history.append(result)
-            return result
-        else:
-            # No 5★: increment 5★ pity.
-            self.pity_5_counter += 1
-
-            # --- Check 4★ pity: if 9 pulls without 4★ or higher, force a 4★ on the 10th pull.
-            if self.pity_4_counter == 9:
-                result = "4*"
-                self.pity_4_counter = 0
-                self.history.append(result)
-                return result
-            else:
-                # Roll for 4★ using the fixed rate.
-                if random.random() < self.base_4_rate:
-                    result = "4*"
-                    self.pity_4_counter = 0
-                    self.history.append(result)
-                    return result
-                else:
-                    # Neither 5★ nor 4★: outcome is 3★.
-                    self.pity_4_counter += 1
-                    result = "3*"
-                    self.history.append(result)
-                    return result
-
-    def multi_pull(self, count=10):
-        """
-        Perform 10 pulls and return the list of outcomes.
-        """
-        results = []
-        for _ in range(count):
-            results.append(self.pull())
-        return results
-
-    def reset_history(self):
-        """
-        Reset pull history and pity counters.
-        """
-        self.history = []
-        self.pity_5_counter = 0
-        self.pity_4_counter = 0
-        self.guaranteed_featured = False
-
-    def get_summary(self):
-        """
-        Return a summary of the pull history including counts for each outcome and total pulls.
-        """
-        summary = {"3*": 0, "4*": 0, "5*": 0, "featured 5*": 0}
-        for result in self.history:
-            if result in summary:
-                summary[result] += 1
-        total_pulls = sum(summary.values())
-        summary["Total Pulls"] = total_pulls
-        return summary
-
-    @staticmethod
-    def simulate_probability(num_pulls, target_featured, num_simulations=10000, simulator_params=None):
-        """
-        Estimate the probability of obtaining at least 'target_featured' featured 5★ (up!5★) 
-        in 'num_pulls' pulls using Monte Carlo simulation.
-        """
-        success_count = 0
-        for _ in range(num_simulations):
-            if simulator_params is None:
-                sim = GachaSimulator()
-            else:
-                sim = GachaSimulator(**simulator_params)
-            featured_count = 0
-            for i in range(num_pulls):
-                result = sim.pull()
-                if result == "featured 5*":
-                    featured_count += 1
-            if featured_count >= target_featured:
-                success_count += 1
-        return success_count / num_simulations
-
-# Mapping function for display conversion
-def map_result(result):
-    mapping = {
-        "3*": "3★",
-        "4*": "4★",
-        "5*": "5★",
-        "featured 5*": "up!5★"
-    }
-    return mapping.get(result, result)
-
-# --- UI Implementation using Tkinter ---
-class GachaApp(tk.Tk):
-    def __init__(self):
-        super().__init__()
-        self.title("Gacha Simulator")
-        self.geometry("900x300")
-        self.simulator = GachaSimulator()
-
-        # Create buttons for pulling and other functions.
-        btn_single = tk.Button(self, text="Single Pull", command=self.single_pull)
-        btn_single.pack(pady=5)
-        
-        btn_ten = tk.Button(self, text="10 Pulls", command=self.ten_pulls)
-        btn_ten.pack(pady=5)
-
-        btn_history = tk.Button(self, text="History", command=self.show_history)
-        btn_history.pack(pady=5)
-
-        btn_probability = tk.Button(self, text="Calculate Probability", command=self.show_probability_window)
-        btn_probability.pack(pady=5)
-
-        self.result_label = tk.Label(self, text="Result: ", font=("Arial", 14))
-        self.result_label.pack(pady=10)
-
-    def single_pull(self):
-        result = self.simulator.pull()
-        display_result = map_result(result)
-        self.result_label.config(text=f"Result: {display_result}")
-
-    def ten_pulls(self):
-        results = self.simulator.multi_pull(10)
-        display_results = ", ".join(map(map_result, results))
-        self.result_label.config(text=f"Results: {display_results}")
-
-    def show_history(self):
-        summary = self.simulator.get_summary()
-        history_text = f"Total Pulls: {summary['Total Pulls']}\n"
-        history_text += f"3★: {summary.get('3*', 0)}\n"
-        history_text += f"4★: {summary.get('4*', 0)}\n"
-        history_text += f"5★: {summary.get('5*', 0)}\n"
-        history_text += f"up!5★: {summary.get('featured 5*', 0)}\n"
-        
-        # Create a new window to display history.
-        history_window = tk.Toplevel(self)
-        history_window.title("Pull History")
-        history_window.geometry("250x200")
-        
-        lbl_history = tk.Label(history_window, text=history_text, justify=tk.LEFT)
-        lbl_history.pack(pady=10)
-
-        # Reset History button inside the history window.
-        btn_reset = tk.Button(history_window, text="Reset History", command=lambda: self.reset_history(history_window))
-        btn_reset.pack(pady=5)
-
-    def reset_history(self, window):
-        self.simulator.reset_history()
-        messagebox.showinfo("Reset", "Pull history has been reset.")
-        window.destroy()
-
-    def show_probability_window(self):
-        # Create a new window for probability calculation.
-        prob_window = tk.Toplevel(self)
-        prob_window.title("Calculate Probability")
-        prob_window.geometry("300x200")
-
-        lbl_info = tk.Label(prob_window, text="Enter planned pulls and target up!5★:")
-        lbl_info.pack(pady=5)
-
-        frame = tk.Frame(prob_window)
-        frame.pack(pady=5)
-
-        lbl_pulls = tk.Label(frame, text="Planned Pulls:")
-        lbl_pulls.grid(row=0, column=0, padx=5, pady=5)
-        entry_pulls = tk.Entry(frame)
-        entry_pulls.grid(row=0, column=1, padx=5, pady=5)
-
-        lbl_target = tk.Label(frame, text="Target up!5★:")
-        lbl_target.grid(row=1, column=0, padx=5, pady=5)
-        entry_target = tk.Entry(frame)
-        entry_target.grid(row=1, column=1, padx=5, pady=5)
-
-        result_label = tk.Label(prob_window, text="")
-        result_label.pack(pady=5)
-
-        def calculate():
-            try:
-                num_pulls = int(entry_pulls.get())
-                target = int(entry_target.get())
-            except ValueError:
-                messagebox.showerror("Error", "Please enter valid integer values.")
-                return
-            probability = GachaSimulator.simulate_probability(num_pulls, target)
-            result_label.config(text=f"Probability: {probability*100:.2f}%")
-        
-        btn_calc = tk.Button(prob_window, text="Calculate", command=calculate)
-        btn_calc.pack(pady=5)
-
-if __name__ == "__main__":
-    app = GachaApp()
-    app.mainloop()
+import tkinter as tk
+from tkinter import messagebox
+from concurrent.futures import ProcessPoolExecutor
+import random
+
+import numpy as np
+
+# Bind the PRNG method once: a local/global load at the call sites instead of
+# a module attribute plus method lookup per draw.
+_rand = random.random
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba is optional: without it the simulation falls back to pure Python.
+    NUMBA_AVAILABLE = False
+    prange = range
+
+try:
+    import cupy as cp
+except ImportError:
+    # CuPy is optional: only simulate_probability_gpu needs it.
+    cp = None
+
+
+def _build_rate_table():
+    """
+    Precompute the soft-pity 5★ rate for every pity counter value, so the
+    hot paths replace the piecewise formula with a single table load.
+    Index 79 is a 1.0 guard for out-of-range counters.
+    """
+    table = np.empty(80, dtype=np.float64)
+    for pity in range(79):
+        pull_number = pity + 1
+        if pull_number <= 65:
+            table[pity] = 0.008
+        elif pull_number <= 70:
+            table[pity] = 0.008 + (pull_number - 65) * 0.04
+        elif pull_number <= 75:
+            table[pity] = 0.208 + (pull_number - 70) * 0.08
+        elif pull_number <= 78:
+            table[pity] = 0.608 + (pull_number - 75) * 0.10
+        else:
+            table[pity] = 1.0
+    table[79] = 1.0
+    return table
+
+
+_RATE_TABLE = _build_rate_table()
+
+# Default banner parameters (shared by GachaSimulator.__init__ and the
+# specialized kernel below).
+_DEFAULT_BASE_4_RATE = 0.085
+_DEFAULT_FEATURED_RATE = 0.5
+
+# Canonical outcome strings, created once so every pull returns the same
+# objects instead of re-materializing literals ("featured 5*" is not interned).
+_R3 = "3*"
+_R4 = "4*"
+_R5 = "5*"
+_RF = "featured 5*"
+# Pull outcomes indexed by result code: 0 = 3★, 1 = 4★, 2 = 5★, 3 = featured 5★.
+_RESULTS = (_R3, _R4, _R5, _RF)
+# Display glyphs in the same code order, for vectorized code → glyph mapping.
+_GLYPHS = np.array(["3★", "4★", "5★", "up!5★"])
+
+
+def _simulate_pulls(num_pulls, target_featured, base_4_rate, featured_rate,
+                    rate_table):
+    """
+    Run one simulated session of 'num_pulls' pulls from a fresh pity state and
+    return the number of featured 5★ obtained.
+
+    This mirrors the logic of GachaSimulator.pull, reading the soft-pity rate
+    from the precomputed table so Numba compiles each lookup to a single
+    aligned load. Returns early once 'target_featured' is reached since
+    callers only compare against it.
+    """
+    pity_5 = 0
+    pity_4 = 0
+    guaranteed_featured = False
+    featured_count = 0
+    for _ in range(num_pulls):
+        if random.random() < rate_table[min(pity_5, 79)]:
+            pity_5 = 0
+            pity_4 = 0
+            if guaranteed_featured:
+                featured_count += 1
+                guaranteed_featured = False
+            elif random.random() < featured_rate:
+                featured_count += 1
+            else:
+                # Lost the 50-50, so next 5★ will be featured.
+                guaranteed_featured = True
+            if featured_count >= target_featured:
+                break
+        else:
+            pity_5 += 1
+            if pity_4 == 9:
+                pity_4 = 0
+            elif random.random() < base_4_rate:
+                pity_4 = 0
+            else:
+                pity_4 += 1
+    return featured_count
+
+
+def _mc(num_simulations, num_pulls, target_featured, base_4_rate, featured_rate,
+        rate_table):
+    """
+    Monte Carlo sweep: run 'num_simulations' independent trials and return
+    how many reached 'target_featured' featured 5★.
+
+    Each trial owns its pity state, so the prange iterations share nothing
+    but the success reduction; Numba spreads them across all cores.
+    """
+    success_count = 0
+    for _ in prange(num_simulations):
+        featured_count = _simulate_pulls(num_pulls, target_featured,
+                                         base_4_rate, featured_rate, rate_table)
+        if featured_count >= target_featured:
+            success_count += 1
+    return success_count
+
+
+def _mc_default(num_simulations, num_pulls, target_featured):
+    """
+    Specialization of _mc for the default banner parameters. The rates and
+    the rate table are module globals here, which Numba freezes as
+    compile-time constants, so the inner comparisons run against immediates
+    instead of loaded arguments.
+    """
+    success_count = 0
+    for _ in prange(num_simulations):
+        featured_count = _simulate_pulls(num_pulls, target_featured,
+                                         _DEFAULT_BASE_4_RATE,
+                                         _DEFAULT_FEATURED_RATE, _RATE_TABLE)
+        if featured_count >= target_featured:
+            success_count += 1
+    return success_count
+
+
+if NUMBA_AVAILABLE:
+    # cache=True persists the compiled kernels on disk so the app doesn't pay
+    # the JIT compile cost on every start.
+    _simulate_pulls = njit(cache=True)(_simulate_pulls)
+    _mc = njit(cache=True, parallel=True)(_mc)
+    _mc_default = njit(cache=True, parallel=True)(_mc_default)
+
+
+_cython_kernel = None
+_cython_checked = False
+
+
+def _get_cython_kernel():
+    """
+    Lazily import the Cython kernel module built by setup.py, or None if
+    the extension was never built. Like the AOT module, it needs neither
+    Numba nor Cython at runtime.
+    """
+    global _cython_kernel, _cython_checked
+    if not _cython_checked:
+        _cython_checked = True
+        try:
+            import gacha_kernel
+            _cython_kernel = gacha_kernel
+        except ImportError:
+            _cython_kernel = None
+    return _cython_kernel
+
+
+_aot_mc = None
+_aot_checked = False
+
+
+def _get_aot_mc():
+    """
+    Lazily import the Monte Carlo kernel AOT-compiled by build_aot.py.
+    Returns None if the extension was never built. The compiled module
+    needs no Numba at runtime, so it gives constrained environments
+    native-speed simulation with zero JIT latency.
+    """
+    global _aot_mc, _aot_checked
+    if not _aot_checked:
+        _aot_checked = True
+        try:
+            from gacha_kernels import mc as compiled_mc
+            _aot_mc = compiled_mc
+        except ImportError:
+            _aot_mc = None
+    return _aot_mc
+
+
+def _mc_numpy(num_simulations, num_pulls, target_featured,
+              base_4_rate, featured_rate, rng):
+    """
+    Vectorized Monte Carlo sweep over a structure-of-arrays state: one entry
+    per simulation, advanced one pull per step with boolean masks (the same
+    arithmetic as _pull_code, applied lane-wise). Each step handles every
+    trial in a handful of NumPy ops, so the interpreter executes num_pulls
+    iterations instead of num_simulations * num_pulls.
+
+    The sweep is memory-bandwidth-bound, so the state uses the narrowest
+    dtypes the domains allow (pity_5 <= 78, pity_4 <= 9, featured count
+    realistically well under 2**16), keeping the working set L1-resident
+    for typical trial counts.
+    """
+    pity_5 = np.zeros(num_simulations, dtype=np.uint8)
+    pity_4 = np.zeros(num_simulations, dtype=np.uint8)
+    guaranteed = np.zeros(num_simulations, dtype=np.bool_)
+    featured = np.zeros(num_simulations, dtype=np.uint16)
+    # Allocate the uniform buffers once and refill them in place each step,
+    # instead of three fresh arrays per pull.
+    u_5 = np.empty(num_simulations, dtype=np.float64)
+    u_feat = np.empty(num_simulations, dtype=np.float64)
+    u_4 = np.empty(num_simulations, dtype=np.float64)
+    for _ in range(num_pulls):
+        rng.random(out=u_5)
+        rng.random(out=u_feat)
+        rng.random(out=u_4)
+        is_5 = u_5 < _RATE_TABLE[pity_5]
+        is_featured = is_5 & (guaranteed | (u_feat < featured_rate))
+        is_4 = ~is_5 & ((pity_4 == 9) | (u_4 < base_4_rate))
+        guaranteed = (is_5 & ~is_featured) | (~is_5 & guaranteed)
+        pity_5 = np.where(is_5, 0, pity_5 + 1)
+        pity_4 = np.where(is_5 | is_4, 0, pity_4 + 1)
+        featured += is_featured
+    return int((featured >= target_featured).sum())
+
+
+class GachaSimulator:
+    def __init__(self, base_4_rate=_DEFAULT_BASE_4_RATE,
+                 featured_rate=_DEFAULT_FEATURED_RATE):
+        """
+        Initialize the simulator.
+          - 5★ probability is determined by the soft pity mechanism:
+              • Pull 1–65: fixed at 0.8% (0.008)
+              • Pull 66–70: each pull increases the rate by 4% (0.04) over the base
+              • Pull 71–75: each pull increases the rate by 8% (0.08) over the previous pull
+              • Pull 76–78: each pull increases the rate by 10% (0.10) over the previous pull
+              • Pull 79: 100% chance
+          - 4★: no soft pity. However, if 9 consecutive pulls yield no 4★ or 5★, the 10th pull (if not 5★) is forced to be 4★.
+          - featured_rate applies to any 5★ pull: if the 50-50 check is lost, the next 5★ is guaranteed featured.
+        """
+        self.base_4_rate = base_4_rate
+        self.featured_rate = featured_rate
+        # Running counts per outcome, indexed by result code (see _RESULTS);
+        # O(1) memory however long the session, no hashing on the hot path.
+        self.counts = [0, 0, 0, 0]
+        self.pity_5_counter = 0      # Pulls since last 5★ (for soft pity)
+        self.pity_4_counter = 0      # Pulls since last 4★ or higher
+        self.guaranteed_featured = False  # Flag: next 5★ is forced to be featured if previous 5★ lost the 50-50
+
+    def get_current_5_rate(self):
+        """
+        Determine the current 5★ rate based on the number of pulls since the last 5★.
+        """
+        return float(_RATE_TABLE[min(self.pity_5_counter, 79)])
+
+    def _pull_code(self):
+        """
+        Simulate a single pull and return its result code (index into
+        _RESULTS) with the following order:
+          1. Roll for 5★ using soft pity.
+          2. If no 5★ is obtained, check if 9 consecutive pulls without 4★ or higher have occurred; if so, force a 4★.
+          3. Otherwise, roll for 4★ using the fixed probability.
+          4. If neither 5★ nor 4★ is obtained, the outcome is 3★.
+
+        The branch cascade is flattened into integer arithmetic on the result
+        code; all three uniforms are drawn up front, which leaves the outcome
+        distribution unchanged since the extra draws are independent of the
+        ones that matter.
+        """
+        u_5 = _rand()
+        u_feat = _rand()
+        u_4 = _rand()
+        is_5 = int(u_5 < _RATE_TABLE[min(self.pity_5_counter, 79)])
+        was_guaranteed = int(self.guaranteed_featured)
+        is_featured = is_5 & (was_guaranteed | int(u_feat < self.featured_rate))
+        is_4 = (1 - is_5) & (int(self.pity_4_counter == 9) | int(u_4 < self.base_4_rate))
+        # A lost 50-50 arms the guarantee; any 5★ while armed consumes it.
+        self.guaranteed_featured = bool((is_5 & (1 - is_featured))
+                                        | ((1 - is_5) & was_guaranteed))
+        self.pity_5_counter = (self.pity_5_counter + 1) * (1 - is_5)
+        self.pity_4_counter = (self.pity_4_counter + 1) * (1 - is_5) * (1 - is_4)
+        code = is_5 * (2 + is_featured) + is_4
+        self.counts[code] += 1
+        return code
+
+    def pull(self):
+        """
+        Simulate a single pull.
+        Returns one of: "3*", "4*", "5*", or "featured 5*".
+        """
+        return _RESULTS[self._pull_code()]
+
+    def multi_pull(self, count=10):
+        """
+        Perform 10 pulls and return the list of outcomes.
+        """
+        results = []
+        for _ in range(count):
+            results.append(self.pull())
+        return results
+
+    def multi_pull_codes(self, count=10):
+        """
+        Perform 'count' pulls and return their result codes as an int8 array,
+        skipping the per-pull outcome strings entirely; display code maps the
+        codes to glyphs in one vectorized step (np.take on _GLYPHS).
+        """
+        codes = np.empty(count, dtype=np.int8)
+        for i in range(count):
+            codes[i] = self._pull_code()
+        return codes
+
+    def multi_pull_counts(self, count=10):
+        """
+        Perform 'count' pulls and return the outcome tally as a tuple
+        (n_3, n_4, n_5, n_featured), without building any per-pull objects.
+        """
+        tally = [0, 0, 0, 0]
+        for _ in range(count):
+            tally[self._pull_code()] += 1
+        return tuple(tally)
+
+    def reset_history(self):
+        """
+        Reset pull history and pity counters.
+        """
+        self.counts = [0, 0, 0, 0]
+        self.pity_5_counter = 0
+        self.pity_4_counter = 0
+        self.guaranteed_featured = False
+
+    def get_summary(self):
+        """
+        Return a summary of the pull history including counts for each outcome and total pulls.
+        """
+        summary = dict(zip(_RESULTS, self.counts))
+        summary["Total Pulls"] = sum(self.counts)
+        return summary
+
+    @staticmethod
+    def simulate_probability(num_pulls, target_featured, num_simulations=10000,
+                             simulator_params=None, seed=None):
+        """
+        Estimate the probability of obtaining at least 'target_featured' featured 5★ (up!5★)
+        in 'num_pulls' pulls using Monte Carlo simulation.
+
+        The trials run in the _mc kernel, which Numba compiles to native code
+        and parallelizes across cores when available. Without Numba, a
+        compiled kernel (Cython or AOT) is used if one was built; otherwise
+        a vectorized NumPy sweep advances all trials in lockstep.
+
+        'seed' makes the Cython and NumPy paths reproducible; the Numba
+        kernels use their own PRNG and ignore it.
+        """
+        if simulator_params is None:
+            sim = GachaSimulator()
+        else:
+            sim = GachaSimulator(**simulator_params)
+        if NUMBA_AVAILABLE:
+            if simulator_params is None:
+                success_count = _mc_default(num_simulations, num_pulls,
+                                            target_featured)
+            else:
+                success_count = _mc(num_simulations, num_pulls, target_featured,
+                                    sim.base_4_rate, sim.featured_rate, _RATE_TABLE)
+        elif _get_cython_kernel() is not None:
+            kernel = _get_cython_kernel()
+            if seed is not None:
+                kernel.seed(seed & 0xFFFFFFFFFFFFFFFF)
+            success_count = kernel.mc(num_simulations, num_pulls, target_featured,
+                                      sim.base_4_rate, sim.featured_rate)
+        elif _get_aot_mc() is not None:
+            success_count = _get_aot_mc()(num_simulations, num_pulls,
+                                          target_featured, sim.base_4_rate,
+                                          sim.featured_rate, _RATE_TABLE)
+        else:
+            rng = np.random.default_rng(np.random.SeedSequence(entropy=seed))
+            success_count = _mc_numpy(num_simulations, num_pulls,
+                                      target_featured, sim.base_4_rate,
+                                      sim.featured_rate, rng)
+        return success_count / num_simulations
+
+    @staticmethod
+    def simulate_probability_gpu(num_pulls, target_featured,
+                                 num_simulations=1_000_000, simulator_params=None):
+        """
+        GPU port of the vectorized Monte Carlo sweep for very large runs
+        (e.g. variance studies): the same structure-of-arrays step as
+        _mc_numpy, executed by CuPy over one lane per simulation. Only the
+        final scalar probability crosses back to the host. Requires CuPy.
+        """
+        if cp is None:
+            raise RuntimeError("simulate_probability_gpu requires CuPy")
+        if simulator_params is None:
+            sim = GachaSimulator()
+        else:
+            sim = GachaSimulator(**simulator_params)
+        rng = cp.random.default_rng()
+        rate_table = cp.asarray(_RATE_TABLE, dtype=cp.float32)
+        pity_5 = cp.zeros(num_simulations, dtype=cp.uint8)
+        pity_4 = cp.zeros(num_simulations, dtype=cp.uint8)
+        guaranteed = cp.zeros(num_simulations, dtype=cp.bool_)
+        featured = cp.zeros(num_simulations, dtype=cp.uint16)
+        for _ in range(num_pulls):
+            u_5 = rng.random(num_simulations, dtype=cp.float32)
+            u_feat = rng.random(num_simulations, dtype=cp.float32)
+            u_4 = rng.random(num_simulations, dtype=cp.float32)
+            is_5 = u_5 < rate_table[pity_5]
+            is_featured = is_5 & (guaranteed | (u_feat < sim.featured_rate))
+            is_4 = ~is_5 & ((pity_4 == 9) | (u_4 < sim.base_4_rate))
+            guaranteed = (is_5 & ~is_featured) | (~is_5 & guaranteed)
+            pity_5 = cp.where(is_5, 0, pity_5 + 1).astype(cp.uint8)
+            pity_4 = cp.where(is_5 | is_4, 0, pity_4 + 1).astype(cp.uint8)
+            featured += is_featured
+        success_count = int((featured >= target_featured).sum().get())
+        return success_count / num_simulations
+
+    @staticmethod
+    def exact_probability(num_pulls, target_featured, simulator_params=None):
+        """
+        Compute the exact probability of obtaining at least 'target_featured'
+        featured 5★ (up!5★) in 'num_pulls' pulls.
+
+        The pull process is a finite Markov chain over
+        (pity_5, pity_4, guaranteed_featured), so tracking the joint
+        distribution of that state and the featured count (capped at the
+        target) for 'num_pulls' steps gives the exact answer with no
+        sampling error. simulate_probability remains available to validate
+        this against Monte Carlo.
+        """
+        if simulator_params is None:
+            sim = GachaSimulator()
+        else:
+            sim = GachaSimulator(**simulator_params)
+        if target_featured <= 0:
+            return 1.0
+        # dist[pity_5, pity_4, guaranteed, featured] = probability mass;
+        # the last featured slot means "target reached" and is absorbing.
+        dist = np.zeros((79, 10, 2, target_featured + 1), dtype=np.float64)
+        dist[0, 0, 0, 0] = 1.0
+        for _ in range(num_pulls):
+            new = np.zeros_like(dist)
+            for pity_5 in range(79):
+                mass = dist[pity_5]  # axes: (pity_4, guaranteed, featured)
+                if not mass.any():
+                    continue
+                rate_5 = _RATE_TABLE[pity_5]
+                # --- 5★ branch: both pity counters reset. ---
+                hit = mass.sum(axis=0) * rate_5  # axes: (guaranteed, featured)
+                featured_mass = hit[1] + hit[0] * sim.featured_rate
+                lost_mass = hit[0] * (1.0 - sim.featured_rate)
+                # Featured: count advances, capped at the target.
+                new[0, 0, 0, 1:] += featured_mass[:-1]
+                new[0, 0, 0, -1] += featured_mass[-1]
+                # Lost the 50-50: next 5★ is guaranteed featured.
+                new[0, 0, 1, :] += lost_mass
+                # --- No 5★: 5★ pity advances, then resolve the 4★ roll. ---
+                miss = mass * (1.0 - rate_5)
+                next_5 = min(pity_5 + 1, 78)
+                # Forced 4★ on the 10th pull without one, or a rolled 4★.
+                new[next_5, 0] += miss[9] + miss[:9].sum(axis=0) * sim.base_4_rate
+                # 3★: 4★ pity advances.
+                new[next_5, 1:10] += miss[:9] * (1.0 - sim.base_4_rate)
+            dist = new
+        # Guard against tiny float accumulation error above 1.0.
+        return min(float(dist[..., -1].sum()), 1.0)
+
+# Mapping function for display conversion
+def map_result(result):
+    mapping = {
+        "3*": "3★",
+        "4*": "4★",
+        "5*": "5★",
+        "featured 5*": "up!5★"
+    }
+    return mapping.get(result, result)
+
+# --- UI Implementation using Tkinter ---
+class GachaApp(tk.Tk):
+    def __init__(self):
+        super().__init__()
+        self.title("Gacha Simulator")
+        self.geometry("900x300")
+        self.simulator = GachaSimulator()
+        # Worker process for the probability calculation so the Monte Carlo
+        # run never blocks the Tk mainloop.
+        self._executor = ProcessPoolExecutor(max_workers=1)
+
+        # Create buttons for pulling and other functions.
+        btn_single = tk.Button(self, text="Single Pull", command=self.single_pull)
+        btn_single.pack(pady=5)
+        
+        btn_ten = tk.Button(self, text="10 Pulls", command=self.ten_pulls)
+        btn_ten.pack(pady=5)
+
+        btn_history = tk.Button(self, text="History", command=self.show_history)
+        btn_history.pack(pady=5)
+
+        btn_probability = tk.Button(self, text="Calculate Probability", command=self.show_probability_window)
+        btn_probability.pack(pady=5)
+
+        self.result_label = tk.Label(self, text="Result: ", font=("Arial", 14))
+        self.result_label.pack(pady=10)
+
+    def single_pull(self):
+        result = self.simulator.pull()
+        display_result = map_result(result)
+        self.result_label.config(text=f"Result: {display_result}")
+
+    def ten_pulls(self):
+        codes = self.simulator.multi_pull_codes(10)
+        display_results = ", ".join(np.take(_GLYPHS, codes))
+        self.result_label.config(text=f"Results: {display_results}")
+
+    def show_history(self):
+        summary = self.simulator.get_summary()
+        history_text = f"Total Pulls: {summary['Total Pulls']}\n"
+        history_text += f"3★: {summary.get('3*', 0)}\n"
+        history_text += f"4★: {summary.get('4*', 0)}\n"
+        history_text += f"5★: {summary.get('5*', 0)}\n"
+        history_text += f"up!5★: {summary.get('featured 5*', 0)}\n"
+        
+        # Create a new window to display history.
+        history_window = tk.Toplevel(self)
+        history_window.title("Pull History")
+        history_window.geometry("250x200")
+        
+        lbl_history = tk.Label(history_window, text=history_text, justify=tk.LEFT)
+        lbl_history.pack(pady=10)
+
+        # Reset History button inside the history window.
+        btn_reset = tk.Button(history_window, text="Reset History", command=lambda: self.reset_history(history_window))
+        btn_reset.pack(pady=5)
+
+    def reset_history(self, window):
+        self.simulator.reset_history()
+        window.destroy()
+        # A modal messagebox would block the mainloop and stall the after()
+        # polling of pending probability futures; show a transient toast.
+        self._show_toast("Pull history has been reset.")
+
+    def _show_toast(self, message, duration_ms=1500):
+        toast = tk.Toplevel(self)
+        toast.overrideredirect(True)
+        toast.geometry(f"+{self.winfo_rootx() + 40}+{self.winfo_rooty() + 40}")
+        lbl = tk.Label(toast, text=message, relief=tk.SOLID, borderwidth=1,
+                       padx=10, pady=5)
+        lbl.pack()
+        self.after(duration_ms, toast.destroy)
+
+    def show_probability_window(self):
+        # Create a new window for probability calculation.
+        prob_window = tk.Toplevel(self)
+        prob_window.title("Calculate Probability")
+        prob_window.geometry("300x200")
+
+        lbl_info = tk.Label(prob_window, text="Enter planned pulls and target up!5★:")
+        lbl_info.pack(pady=5)
+
+        frame = tk.Frame(prob_window)
+        frame.pack(pady=5)
+
+        lbl_pulls = tk.Label(frame, text="Planned Pulls:")
+        lbl_pulls.grid(row=0, column=0, padx=5, pady=5)
+        entry_pulls = tk.Entry(frame)
+        entry_pulls.grid(row=0, column=1, padx=5, pady=5)
+
+        lbl_target = tk.Label(frame, text="Target up!5★:")
+        lbl_target.grid(row=1, column=0, padx=5, pady=5)
+        entry_target = tk.Entry(frame)
+        entry_target.grid(row=1, column=1, padx=5, pady=5)
+
+        result_label = tk.Label(prob_window, text="")
+        result_label.pack(pady=5)
+
+        def calculate():
+            try:
+                num_pulls = int(entry_pulls.get())
+                target = int(entry_target.get())
+            except ValueError:
+                messagebox.showerror("Error", "Please enter valid integer values.")
+                return
+            # Run the calculation in the worker process and poll the future
+            # with after() so the UI stays responsive.
+            btn_calc.config(state=tk.DISABLED)
+            result_label.config(text="Calculating...")
+            future = self._executor.submit(GachaSimulator.exact_probability,
+                                           num_pulls, target)
+            prob_window.after(100, self._poll_probability, future, result_label, btn_calc)
+
+        btn_calc = tk.Button(prob_window, text="Calculate", command=calculate)
+        btn_calc.pack(pady=5)
+
+    def _poll_probability(self, future, result_label, btn_calc):
+        if not result_label.winfo_exists():
+            # Window was closed while the worker was still running.
+            return
+        if not future.done():
+            result_label.after(100, self._poll_probability, future, result_label, btn_calc)
+            return
+        probability = future.result()
+        result_label.config(text=f"Probability: {probability*100:.2f}%")
+        btn_calc.config(state=tk.NORMAL)
+
+if __name__ == "__main__":
+    app = GachaApp()
+    app.mainloop()
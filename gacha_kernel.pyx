@@ -0,0 +1,126 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
+# cython: language_level=3
+"""
+Cython implementation of the Monte Carlo pull kernels, for environments
+where Numba cannot be installed. Build in place with:
+
+    python setup.py build_ext --inplace
+
+gachaWithUI picks the compiled module up automatically; without it the
+simulation falls back to the multiprocessing / NumPy paths.
+"""
+from libc.time cimport time
+
+
+cdef double _rate_table[80]
+
+
+cdef void _init_rate_table():
+    # Same soft-pity ladder as gachaWithUI._build_rate_table; index 79 is
+    # a 1.0 guard for out-of-range counters.
+    cdef int pity, pull_number
+    for pity in range(79):
+        pull_number = pity + 1
+        if pull_number <= 65:
+            _rate_table[pity] = 0.008
+        elif pull_number <= 70:
+            _rate_table[pity] = 0.008 + (pull_number - 65) * 0.04
+        elif pull_number <= 75:
+            _rate_table[pity] = 0.208 + (pull_number - 70) * 0.08
+        elif pull_number <= 78:
+            _rate_table[pity] = 0.608 + (pull_number - 75) * 0.10
+        else:
+            _rate_table[pity] = 1.0
+    _rate_table[79] = 1.0
+
+
+# xoshiro256** (public-domain reference implementation), seeded through
+# splitmix64: much better distributed than libc rand() and fast enough to
+# disappear next to the pull logic.
+cdef unsigned long long _state[4]
+
+
+cdef inline unsigned long long _rotl(unsigned long long x, int k) noexcept nogil:
+    return (x << k) | (x >> (64 - k))
+
+
+cdef inline double _next_double() noexcept nogil:
+    cdef unsigned long long result = _rotl(_state[1] * 5, 7) * 9
+    cdef unsigned long long t = _state[1] << 17
+    _state[2] ^= _state[0]
+    _state[3] ^= _state[1]
+    _state[1] ^= _state[2]
+    _state[0] ^= _state[3]
+    _state[2] ^= t
+    _state[3] = _rotl(_state[3], 45)
+    # Take the top 53 bits for a uniform double in [0, 1).
+    return (result >> 11) * (1.0 / 9007199254740992.0)
+
+
+def seed(unsigned long long entropy):
+    """
+    Seed the generator, expanding the single value into the four xoshiro
+    state words with splitmix64.
+    """
+    cdef unsigned long long z
+    cdef int i
+    for i in range(4):
+        entropy += <unsigned long long>0x9E3779B97F4A7C15
+        z = entropy
+        z = (z ^ (z >> 30)) * <unsigned long long>0xBF58476D1CE4E5B9
+        z = (z ^ (z >> 27)) * <unsigned long long>0x94D049BB133111EB
+        _state[i] = z ^ (z >> 31)
+
+
+cdef long long _simulate_pulls(long long num_pulls, long long target_featured,
+                               double base_4_rate, double featured_rate) noexcept nogil:
+    # Mirrors gachaWithUI._simulate_pulls, including the early return once
+    # the target is reached.
+    cdef int pity_5 = 0
+    cdef int pity_4 = 0
+    cdef bint guaranteed_featured = 0
+    cdef long long featured_count = 0
+    cdef long long i
+    for i in range(num_pulls):
+        if _next_double() < _rate_table[pity_5 if pity_5 < 79 else 79]:
+            pity_5 = 0
+            pity_4 = 0
+            if guaranteed_featured:
+                featured_count += 1
+                guaranteed_featured = 0
+            elif _next_double() < featured_rate:
+                featured_count += 1
+            else:
+                # Lost the 50-50, so next 5★ will be featured.
+                guaranteed_featured = 1
+            if featured_count >= target_featured:
+                break
+        else:
+            pity_5 += 1
+            if pity_4 == 9:
+                pity_4 = 0
+            elif _next_double() < base_4_rate:
+                pity_4 = 0
+            else:
+                pity_4 += 1
+    return featured_count
+
+
+def mc(long long num_simulations, long long num_pulls, long long target_featured,
+       double base_4_rate, double featured_rate):
+    """
+    Run 'num_simulations' independent trials and return how many reached
+    'target_featured' featured 5★.
+    """
+    cdef long long success_count = 0
+    cdef long long s
+    with nogil:
+        for s in range(num_simulations):
+            if _simulate_pulls(num_pulls, target_featured,
+                               base_4_rate, featured_rate) >= target_featured:
+                success_count += 1
+    return success_count
+
+
+_init_rate_table()
+seed(<unsigned long long>time(NULL))
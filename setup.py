@@ -0,0 +1,15 @@
+"""
+Build the optional Cython Monte Carlo kernel in place:
+
+    python setup.py build_ext --inplace
+
+Requires Cython and a C compiler. See build_aot.py for the Numba-based
+equivalent; either compiled kernel is picked up automatically.
+"""
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="wuwa-simulator-kernel",
+    ext_modules=cythonize("gacha_kernel.pyx"),
+)